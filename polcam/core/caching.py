@@ -7,6 +7,7 @@ See LICENSE file for full license details.
 """
 
 from typing import Any, Dict, Optional, TypeVar, Generic
+import threading
 import time
 
 T = TypeVar('T')
@@ -106,6 +107,8 @@ class WhiteBalanceCache:
         self._merged_mode = TimedCache[Any](valid_duration)
         self._quad_mode = TimedCache[Dict[int, Any]](valid_duration)
         self._pol_mode = TimedCache[Any](valid_duration)
+        # 单角度/四角度缓存的读-改-写需加锁，各角度可能在不同线程中同时写入
+        self._lock = threading.Lock()
         
     def get_single(self, angle: int) -> Optional[Any]:
         """获取单角度模式的缓存"""
@@ -116,9 +119,10 @@ class WhiteBalanceCache:
         
     def set_single(self, angle: int, gains: Any):
         """设置单角度模式的缓存"""
-        cache = self._single_mode.get('angles') or {}
-        cache[angle] = gains
-        self._single_mode.set('angles', cache)
+        with self._lock:
+            cache = self._single_mode.get('angles') or {}
+            cache[angle] = gains
+            self._single_mode.set('angles', cache)
         
     def get_merged(self) -> Optional[Any]:
         """获取合成模式的缓存"""
@@ -137,9 +141,10 @@ class WhiteBalanceCache:
         
     def set_quad(self, angle: int, gains: Any):
         """设置四角度模式的缓存"""
-        cache = self._quad_mode.get('angles') or {}
-        cache[angle] = gains
-        self._quad_mode.set('angles', cache)
+        with self._lock:
+            cache = self._quad_mode.get('angles') or {}
+            cache[angle] = gains
+            self._quad_mode.set('angles', cache)
         
     def get_pol(self) -> Optional[Any]:
         """获取偏振分析模式的缓存"""
@@ -10,9 +10,118 @@ import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import os
+import functools
 from typing import List, Tuple
 from ..gui.styles import Styles
 
+# 帮助图像使用的字体，首次使用时加载
+_FONTS = None
+
+
+def _get_fonts():
+    """懒加载标题与正文字体，加载后全局复用"""
+    global _FONTS
+    if _FONTS is None:
+        font_path = "C:/Windows/Fonts/msyh.ttc"
+        if not os.path.exists(font_path):
+            font_path = "C:/Windows/Fonts/simhei.ttf"
+        _FONTS = (ImageFont.truetype(font_path, 48),
+                  ImageFont.truetype(font_path, 36))
+    return _FONTS
+
+
+def _build_dash_segments(x: int, y: int, w: int, h: int,
+                         cursor_size: int,
+                         dash_length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """向量化生成游标延伸虚线的线段端点（相对于分图左上角）
+
+    各分图尺寸相同且游标相对位置一致，线段只需生成一次，
+    绘制时按分图原点平移即可
+
+    Returns:
+        (h_segments, v_segments): 形状为 (N, 2, 2) 的int32端点数组，
+        平移后可直接交给 cv2.polylines 绘制
+    """
+    # 水平延伸线：左延伸与右延伸的虚线段起点，超出分图边界的线段被丢弃
+    h_offsets = np.arange(cursor_size, w, dash_length * 2)
+    left = x - h_offsets - dash_length
+    right = x + h_offsets
+    starts_x = np.concatenate([left[left >= 0],
+                               right[right + dash_length <= w]])
+    h_segments = np.empty((len(starts_x), 2, 2), dtype=np.int32)
+    h_segments[:, 0, 0] = starts_x
+    h_segments[:, 1, 0] = starts_x + dash_length
+    h_segments[:, :, 1] = y
+
+    # 垂直延伸线：上延伸与下延伸的虚线段起点
+    v_offsets = np.arange(cursor_size, h, dash_length * 2)
+    up = y - v_offsets - dash_length
+    down = y + v_offsets
+    starts_y = np.concatenate([up[up >= 0],
+                               down[down + dash_length <= h]])
+    v_segments = np.empty((len(starts_y), 2, 2), dtype=np.int32)
+    v_segments[:, :, 0] = x
+    v_segments[:, 0, 1] = starts_y
+    v_segments[:, 1, 1] = starts_y + dash_length
+
+    return h_segments, v_segments
+
+
+@functools.lru_cache(maxsize=1)
+def _render_default_image() -> np.ndarray:
+    """渲染默认的帮助图像
+
+    字体加载失败时抛出异常，lru_cache 不缓存异常，下次调用会重新尝试
+    """
+    # 加载中文字体
+    title_font, text_font = _get_fonts()
+
+    pil_image = Image.new('RGB', (1920, 1440), color='black')
+    draw = ImageDraw.Draw(pil_image)
+    
+    guide_text = [
+        "偏振相机控制系统使用说明", 
+        "",
+        "基本操作：",
+        "1. 连接相机：点击左侧'连接相机'按钮",
+        "2. 调节图像：使用曝光和增益控制",
+        "3. 采集图像：可选择'单帧采集'或'连续采集'", 
+        "4. 显示模式：在顶部下拉框选择不同显示方式",
+        "",
+        "图像工具：",
+        "- 游标：选择图像工具栏中的游标按钮，查看图像像素信息", 
+        "- 复原：点击图像工具栏复原按钮恢复原始显示",
+        "",
+        "图像处理：",
+        "- 白平衡：彩色模式下可开启自动白平衡",
+        "- 偏振分析：可查看DOLP、AOLP等偏振信息", 
+        "- 图像保存：工具栏中的保存按钮可保存原始图像和处理结果",
+        "- 图像保存：工具栏中的读取按钮可读取原始图像"
+    ]
+    
+    # 计算文本总高度
+    text_height = 70
+    total_height = len(guide_text) * text_height
+    
+    # 垂直居中的起始y坐标
+    start_y = (1440 - total_height) // 2
+    
+    for i, text in enumerate(guide_text):
+        font = title_font if i == 0 else text_font
+        color = (100, 200, 255) if i == 0 else (200, 200, 200)
+        
+        # 计算每行文本宽度并水平居中
+        text_width = font.getlength(text)
+        x = (1920 - text_width) // 2
+        y = start_y + i * text_height
+        
+        draw.text((x, y), text, font=font, fill=color)
+    
+    image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+    image.setflags(write=False)
+    return image
+
+
 class ImagePlotter:
     """图像绘制工具类，负责所有的图像绘制操作"""
     
@@ -50,6 +159,15 @@ class ImagePlotter:
         
         cursor_color = (0, 255, 0)  # 绿色游标
         
+        # 循环不变量：中心点半径、虚线参数与相对于分图原点的虚线段
+        dot_radius = max(2, line_thickness * 2)
+        thin_thickness = max(1, line_thickness // 2)
+        white_color = (255, 255, 255)
+        dash_length = 5
+        h_segments, v_segments = _build_dash_segments(
+            x, y, w, h, cursor_size, dash_length)
+        dash_segments = np.concatenate([h_segments, v_segments])
+        
         # 在每个分图上绘制游标
         for quad_y, quad_x in quad_positions:
             center_x = quad_x + x
@@ -66,48 +184,13 @@ class ImagePlotter:
                     cursor_color, line_thickness)
             
             # 绘制中心点
-            dot_radius = max(2, line_thickness * 2)
             cv2.circle(canvas, (center_x, center_y), dot_radius, 
                       cursor_color, -1)
 
-            # 绘制延伸的白色虚线
-            thin_thickness = max(1, line_thickness // 2)
-            white_color = (255, 255, 255)
-            dash_length = 5
-
-            # 水平延伸线
-            for i in range(cursor_size, w, dash_length * 2):
-                # 左延伸
-                start_x = center_x - i - dash_length
-                if start_x >= quad_x:
-                    cv2.line(canvas,
-                            (start_x, center_y),
-                            (start_x + dash_length, center_y),
-                            white_color, thin_thickness)
-                # 右延伸
-                start_x = center_x + i
-                if start_x + dash_length <= quad_x + w:
-                    cv2.line(canvas,
-                            (start_x, center_y),
-                            (start_x + dash_length, center_y),
-                            white_color, thin_thickness)
-
-            # 垂直延伸线
-            for i in range(cursor_size, h, dash_length * 2):
-                # 上延伸
-                start_y = center_y - i - dash_length
-                if start_y >= quad_y:
-                    cv2.line(canvas,
-                            (center_x, start_y),
-                            (center_x, start_y + dash_length),
-                            white_color, thin_thickness)
-                # 下延伸
-                start_y = center_y + i
-                if start_y + dash_length <= quad_y + h:
-                    cv2.line(canvas,
-                            (center_x, start_y),
-                            (center_x, start_y + dash_length),
-                            white_color, thin_thickness)
+            # 虚线段平移到当前分图后一次批量绘制（保持分图间的绘制顺序）
+            if len(dash_segments):
+                cv2.polylines(canvas, list(dash_segments + (quad_x, quad_y)), False,
+                              white_color, thin_thickness)
                     
         return canvas
 
@@ -125,13 +208,6 @@ class ImagePlotter:
         quad_positions = [(0, 0), (0, w), (h, 0), (h, w)]
         quad_size = (h, w)
         
-        # 确保所有图像都是三通道BGR格式
-        processed_images = []
-        for img in images:
-            if len(img.shape) == 2:
-                img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
-            processed_images.append(img)
-        
         # 绘制图像和标题
         # 根据子图高度缩放字体参数，使标题在屏幕上的视觉大小保持一致
         scale = h / Styles.IMAGE_TITLE_REFERENCE_HEIGHT
@@ -140,8 +216,12 @@ class ImagePlotter:
         y_offset = max(15, round(Styles.IMAGE_TITLE_Y_OFFSET * scale))
         x_offset = max(5, round(Styles.IMAGE_TITLE_X_OFFSET * scale))
 
-        for img, (y, x), title in zip(processed_images, quad_positions, titles):
-            canvas[y:y+h, x:x+w] = img
+        for img, (y, x), title in zip(images, quad_positions, titles):
+            if len(img.shape) == 2:
+                # 灰度图广播到BGR三通道，直接写入画布
+                canvas[y:y+h, x:x+w] = img[:, :, None]
+            else:
+                canvas[y:y+h, x:x+w] = img
             cv2.putText(canvas, title,
                        (x + x_offset, y + y_offset),
                        cv2.FONT_HERSHEY_SIMPLEX,
@@ -153,57 +233,13 @@ class ImagePlotter:
 
     @staticmethod
     def get_default_image() -> np.ndarray:
-        """创建默认的帮助图像"""
-        pil_image = Image.new('RGB', (1920, 1440), color='black')
-        draw = ImageDraw.Draw(pil_image)
-        
-        # 加载中文字体
+        """创建默认的帮助图像
+
+        帮助图像内容固定，渲染结果会被缓存；返回的数组为只读，
+        调用方如需修改必须先复制。字体加载失败时返回None，下次调用重新尝试
+        """
         try:
-            font_path = "C:/Windows/Fonts/msyh.ttc"
-            if not os.path.exists(font_path):
-                font_path = "C:/Windows/Fonts/simhei.ttf"
-            title_font = ImageFont.truetype(font_path, 48)
-            text_font = ImageFont.truetype(font_path, 36)
+            return _render_default_image()
         except Exception as e:
             print(f"加载字体失败: {e}")
             return None
-        
-        guide_text = [
-            "偏振相机控制系统使用说明", 
-            "",
-            "基本操作：",
-            "1. 连接相机：点击左侧'连接相机'按钮",
-            "2. 调节图像：使用曝光和增益控制",
-            "3. 采集图像：可选择'单帧采集'或'连续采集'", 
-            "4. 显示模式：在顶部下拉框选择不同显示方式",
-            "",
-            "图像工具：",
-            "- 游标：选择图像工具栏中的游标按钮，查看图像像素信息", 
-            "- 复原：点击图像工具栏复原按钮恢复原始显示",
-            "",
-            "图像处理：",
-            "- 白平衡：彩色模式下可开启自动白平衡",
-            "- 偏振分析：可查看DOLP、AOLP等偏振信息", 
-            "- 图像保存：工具栏中的保存按钮可保存原始图像和处理结果",
-            "- 图像保存：工具栏中的读取按钮可读取原始图像"
-        ]
-        
-        # 计算文本总高度
-        text_height = 70
-        total_height = len(guide_text) * text_height
-        
-        # 垂直居中的起始y坐标
-        start_y = (1440 - total_height) // 2
-        
-        for i, text in enumerate(guide_text):
-            font = title_font if i == 0 else text_font
-            color = (100, 200, 255) if i == 0 else (200, 200, 200)
-            
-            # 计算每行文本宽度并水平居中
-            text_width = font.getlength(text)
-            x = (1920 - text_width) // 2
-            y = start_y + i * text_height
-            
-            draw.text((x, y), text, font=font, fill=color)
-        
-        return cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
@@ -7,11 +7,160 @@ See LICENSE file for full license details.
 import numpy as np
 import polanalyser as pa
 import cv2
-from typing import List, Tuple, Union
+import logging
+import threading
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+
+def _build_docp_lut() -> np.ndarray:
+    """构建DoCP颜色查找表
+
+    索引i对应有符号DoCP值(i-255)/255：负值（左旋）映射为蓝色系，
+    正值（右旋）映射为红色系，0为白色
+    """
+    signed = np.arange(511) - 255
+    intensity = 255 - np.abs(signed)  # (1-|v|)*255
+    lut = np.empty((511, 3), dtype=np.uint8)
+    lut[:, 0] = np.where(signed > 0, intensity, 255)  # B
+    lut[:, 1] = intensity                             # G
+    lut[:, 2] = np.where(signed < 0, intensity, 255)  # R
+    return lut
+
+
+_DOCP_LUT = _build_docp_lut()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_aolp_lut() -> np.ndarray:
+    """获取AoLP查找表（首次使用时构建）
+
+    S1、S2 均为 [-255, 255] 内的整数，按 (S2+255)*511 + (S1+255) 展平索引，
+    表项为对应的偏振角（0-180度，float32）。表约1MB，只在进入偏振分析时构建，
+    构建后设为只读供所有线程共享。
+    """
+    values = np.arange(-255, 256, dtype=np.float32)
+    aolp = np.rad2deg(np.arctan2(values[:, None], values[None, :]) / 2) + 90
+    lut = aolp.astype(np.float32).ravel()
+    lut.setflags(write=False)
+    return lut
+
+
+# 锐化基础卷积核（float32，按锐化强度缩放后使用）
+_SHARPEN_BASE = np.array([[-1, -1, -1],
+                          [-1,  9, -1],
+                          [-1, -1, -1]], dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=8)
+def _sharpen_kernel(sharpness: float) -> np.ndarray:
+    """按锐化强度缩放的卷积核，强度不变时各帧、各图像共享同一个只读核"""
+    kernel = _SHARPEN_BASE * np.float32(sharpness)
+    kernel.setflags(write=False)
+    return kernel
+
+
+# 多角度图像并行转换用的线程池（cvtColor执行时释放GIL）
+_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ImageProcessor")
+
+# 逐帧复用的中间计算缓冲区，按线程隔离
+_scratch = threading.local()
+_MAX_SCRATCH_BUFFERS = 32
+
+
+def _get_scratch(name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """获取当前线程可复用的中间缓冲区
+
+    实时采集时每帧尺寸相同，中间结果（Stokes参数等）无需每帧重新分配。
+    缓冲区按 (用途, 尺寸, 类型) 以LRU方式保留，交替处理不同尺寸的图像时
+    也不会反复重新分配。缓冲区内容在下次调用时会被覆盖，不能作为结果返回给调用方。
+    """
+    buffers = getattr(_scratch, 'buffers', None)
+    if buffers is None:
+        buffers = _scratch.buffers = OrderedDict()
+    key = (name, shape, np.dtype(dtype))
+    buf = buffers.get(key)
+    if buf is None:
+        if len(buffers) >= _MAX_SCRATCH_BUFFERS:
+            buffers.popitem(last=False)
+        buf = buffers[key] = np.empty(shape, dtype=dtype)
+    else:
+        buffers.move_to_end(key)
+    return buf
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """检测OpenCV是否带CUDA支持且存在可用设备（只检测一次）"""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+def _denoise_cuda(image: np.ndarray, h: float) -> np.ndarray:
+    """在GPU上执行非局部均值降噪（仅支持uint8单通道/三通道图像）
+
+    上传/下载用的 GpuMat 按线程复用，参数与CPU版本一致（模板窗口7，搜索窗口21）
+    """
+    gpu = getattr(_scratch, 'gpu', None)
+    if gpu is None:
+        gpu = _scratch.gpu = (cv2.cuda_GpuMat(), cv2.cuda_GpuMat())
+    src, dst = gpu
+    src.upload(image)
+    if image.ndim == 3:
+        cv2.cuda.fastNlMeansDenoisingColored(src, h, h, dst, 21, 7)
+    else:
+        cv2.cuda.fastNlMeansDenoising(src, h, dst, 21, 7)
+    return dst.download()
+
+
+def _demosaic_polar_rgb(raw_image: np.ndarray) -> List[np.ndarray]:
+    """彩色偏振传感器的边缘感知解码（与 pa.COLOR_PolarRGB_EA 结果一致）
+
+    与 polanalyser 的实现步骤相同：先对四个偏振子图分别做Bayer解码，
+    再对每个颜色通道做偏振解码。区别在于三个颜色通道相互独立，交由线程池
+    并行执行（cvtColor执行时释放GIL），结果用 cv2.merge 一次性组装，
+    避免逐通道的跨步写入。
+    """
+    height, width = raw_image.shape
+
+    # 1. 彩色解码：超像素内 (0,0)=90°, (0,1)=45°, (1,0)=135°, (1,1)=0°
+    mpfa_bgr = _get_scratch('mpfa_bgr', (height, width, 3), raw_image.dtype)
+    offsets = [(j, i) for j in range(2) for i in range(2)]
+    debayered = _POOL.map(
+        lambda ji: cv2.cvtColor(raw_image[ji[0]::2, ji[1]::2], cv2.COLOR_BayerBG2BGR_EA),
+        offsets)
+    for (j, i), img_bgr in zip(offsets, debayered):
+        mpfa_bgr[j::2, i::2] = img_bgr
+
+    # 2. 偏振解码：每个颜色通道得到 [0°, 45°, 90°, 135°]
+    def _demosaic_channel(mpfa: np.ndarray) -> List[np.ndarray]:
+        img_000, _, img_090 = cv2.split(cv2.cvtColor(mpfa, cv2.COLOR_BayerBG2BGR_EA))
+        img_045, _, img_135 = cv2.split(cv2.cvtColor(mpfa, cv2.COLOR_BayerGR2BGR_EA))
+        return [img_000, img_045, img_090, img_135]
+
+    channels = list(_POOL.map(_demosaic_channel, cv2.split(mpfa_bgr)))
+
+    # 3. 按角度合并BGR三通道
+    return [cv2.merge([channel[k] for channel in channels]) for k in range(4)]
+
 
 class ImageProcessor:
     def __init__(self):
-        pass
+        self._logger = logging.getLogger("polcam.ImageProcessor")
+        # 白平衡查找表缓存：增益值 -> (256, 1, 3) uint8 查找表
+        self._wb_luts = {}
+        self._max_wb_luts = 16
+        self._wb_luts_lock = threading.Lock()
+        # 上一帧已验证通过的原始图像签名 (shape, dtype)
+        self._last_raw_sig = None
+        # 自动白平衡：按白平衡上下文（单角度、合成图、各角度等）分别记录
+        # 上次计算增益时的 (通道均值, 对应增益)，不同图像互不沿用增益
+        self._last_wb: Dict[Hashable, Tuple[np.ndarray, np.ndarray]] = {}
+        self._wb_drift_tolerance = 0.01
 
     @staticmethod
     def demosaic_polarization(raw_image: np.ndarray, mono: bool = False) -> List[np.ndarray]:
@@ -22,6 +171,38 @@ class ImageProcessor:
             mono: True 使用 PolarMono_EA（返回4张灰度2D图），
                   False 使用 PolarRGB_EA（返回4张BGR 3通道图）
         """
+        ImageProcessor._validate_raw_image(raw_image)
+        return ImageProcessor._decode_polarization(raw_image, mono)
+
+    def demosaic_polarization_fast(self, raw_image: np.ndarray, mono: bool = False) -> List[np.ndarray]:
+        """实时采集用的偏振解码入口
+
+        连续采集时每帧的尺寸和类型通常不变：与上一帧验证通过的签名一致时
+        跳过输入验证，否则走完整验证并记录新签名。参数与返回值同 demosaic_polarization。
+        """
+        if type(raw_image) is np.ndarray and (raw_image.shape, raw_image.dtype) == self._last_raw_sig:
+            return ImageProcessor._decode_polarization(raw_image, mono)
+        ImageProcessor._validate_raw_image(raw_image)
+        self._last_raw_sig = (raw_image.shape, raw_image.dtype)
+        return ImageProcessor._decode_polarization(raw_image, mono)
+
+    @staticmethod
+    def _decode_polarization(raw_image: np.ndarray, mono: bool) -> List[np.ndarray]:
+        """偏振解码（输入已验证）"""
+        if not mono and raw_image.dtype in (np.uint8, np.uint16):
+            # 彩色偏振：按颜色通道并行解码
+            [img_000, img_045, img_090, img_135] = _demosaic_polar_rgb(raw_image)
+        else:
+            demosaic_code = pa.COLOR_PolarMono_EA if mono else pa.COLOR_PolarRGB_EA
+            [img_000, img_045, img_090, img_135] = pa.demosaicing(
+                raw_image, demosaic_code
+            )
+
+        return [img_000, img_045, img_090, img_135]
+
+    @staticmethod
+    def _validate_raw_image(raw_image: np.ndarray):
+        """验证原始偏振图像的类型和尺寸"""
         # 输入类型验证
         if not isinstance(raw_image, np.ndarray):
             raise TypeError("输入必须是numpy数组类型")
@@ -36,23 +217,26 @@ class ImageProcessor:
         if raw_image.shape[0] < 4 or raw_image.shape[1] < 4:
             raise ValueError("输入图像尺寸太小，最小需要4x4像素")
 
-        # 偏振解码
-        demosaic_code = pa.COLOR_PolarMono_EA if mono else pa.COLOR_PolarRGB_EA
-        [img_000, img_045, img_090, img_135] = pa.demosaicing(
-            raw_image, demosaic_code
-        )
+    @staticmethod
+    def get_scratch(name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """获取当前线程可复用的中间缓冲区，供处理流水线的其他模块共用
 
-        return [img_000, img_045, img_090, img_135]
+        内容在下次以相同 (用途, 尺寸, 类型) 调用时会被覆盖，只能存放中间结果
+        """
+        return _get_scratch(name, shape, dtype)
 
     @staticmethod
-    def to_grayscale(color_images) -> np.ndarray:
+    def to_grayscale(color_images, out: np.ndarray = None) -> np.ndarray:
         """将彩色图像或图像列表转换为灰度图像
         
         Args:
             color_images: 单张图像或图像列表，支持RGB和已经是灰度的图像
+            out: 可选的 (N, H, W) uint8 输出块，仅对包含彩色图像的列表生效；
+                各灰度图按通道连续写入该块（SoA布局），可直接交给
+                calculate_polarization_parameters
             
         Returns:
-            单张灰度图像或灰度图像列表
+            单张灰度图像、灰度图像列表，或传入的输出块
         """
         def _to_gray(img):
             # 如果已经是灰度图，直接返回
@@ -62,16 +246,40 @@ class ImageProcessor:
             return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
             
         if isinstance(color_images, list):
+            # 整组已是灰度图（如黑白偏振相机的解码结果）时直接返回，不必逐张派发
+            if all(img.ndim == 2 for img in color_images):
+                return list(color_images)
+            if out is not None:
+                def _to_gray_into(i):
+                    img = color_images[i]
+                    if img.ndim == 2:
+                        np.copyto(out[i], img)
+                    else:
+                        cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=out[i])
+                list(_POOL.map(_to_gray_into, range(len(color_images))))
+                return out
+            # 多张图像相互独立，并行转换
+            if len(color_images) >= 2:
+                return list(_POOL.map(_to_gray, color_images))
             return [_to_gray(img) for img in color_images]
         else:
             return _to_gray(color_images)
 
     @staticmethod
-    def calculate_polarization_parameters(color_images: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def calculate_polarization_parameters(color_images: Union[List[np.ndarray], np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """计算偏振参数：线偏振度(DoLP)、偏振角(AoLP)和圆偏振度(DoCP)
         
-        根据四个偏振态图像计算偏振参数
+        根据四个偏振态图像计算偏振参数。输入可以是4张图像的列表，
+        也可以是 (4, H, W) 的uint8灰度块（各角度按通道连续存放）
         """
+        # 灰度块输入：整体校验一次，按角度切出连续视图
+        if isinstance(color_images, np.ndarray):
+            if color_images.ndim != 3 or color_images.shape[0] != 4:
+                raise ValueError("灰度块形状必须为 (4, H, W)")
+            if color_images.dtype != np.uint8:
+                raise TypeError("输入图像必须是uint8类型")
+            color_images = list(color_images)
+
         # 验证输入
         if not isinstance(color_images, list):
             raise TypeError("输入必须是图像列表")
@@ -85,36 +293,73 @@ class ImageProcessor:
                 raise TypeError("输入图像必须是numpy数组")
             if img.dtype != np.uint8:
                 raise TypeError("输入图像必须是uint8类型")
+            if img.shape[:2] != color_images[0].shape[:2]:
+                raise ValueError("所有角度的图像尺寸必须一致")
+        
+        # 中间结果写入逐帧复用的缓冲区，只有返回的三个参数图是新分配的
+        shape = color_images[0].shape[:2]
         
-        # 确保输入都是灰度图
-        gray_images = [
-            img if len(img.shape) == 2 
-            else cv2.cvtColor(img.astype(np.uint8), cv2.COLOR_BGR2GRAY) 
-            for img in color_images
-        ]
+        # 确保输入都是灰度图：已是灰度的直接使用（调用方可传入已转换好的灰度图），
+        # 彩色图在线程池中并行转换到复用的灰度缓冲区
+        gray_images = list(color_images)
+        color_indices = [i for i, img in enumerate(color_images) if len(img.shape) != 2]
+        if color_indices:
+            # 缓冲区按线程隔离，需在当前线程取出后再交给工作线程写入
+            gray_bufs = {i: _get_scratch(f'gray_{i}', shape, np.uint8) for i in color_indices}
+            converted = _POOL.map(
+                lambda i: cv2.cvtColor(color_images[i], cv2.COLOR_BGR2GRAY, dst=gray_bufs[i]),
+                color_indices)
+            for i, gray in zip(color_indices, converted):
+                gray_images[i] = gray
         
-        I_000, I_045, I_090, I_135 = gray_images
+        I_000, I_045, I_090, I_135 = (img.reshape(shape) for img in gray_images)
         
         # 计算改进的Stokes参数
-        S0 = (I_000 + I_090 + I_045 + I_135) / 2  # 总强度
-        S1 = I_000 - I_090                         # 水平/垂直差异
-        S2 = I_045 - I_135                         # 45度差异
-        S3 = (I_045 + I_135) - (I_000 + I_090)    # 圆偏振分量
+        # OpenCV直接读取uint8输入、输出int16（和值最大1020，不会溢出），
+        # 每个分量单次遍历完成，无需先整体提升类型
+        pair_0_90 = cv2.add(I_000, I_090, dst=_get_scratch('pair_0_90', shape, np.int16),
+                            dtype=cv2.CV_16S)
+        pair_45_135 = cv2.add(I_045, I_135, dst=_get_scratch('pair_45_135', shape, np.int16),
+                              dtype=cv2.CV_16S)
+        S0_sum = cv2.add(pair_0_90, pair_45_135,      # 总强度的2倍，即 S0 = S0_sum / 2
+                         dst=_get_scratch('S0', shape, np.int16))
+        S1 = cv2.subtract(I_000, I_090, dst=_get_scratch('S1', shape, np.int16),
+                          dtype=cv2.CV_16S)          # 水平/垂直差异
+        S2 = cv2.subtract(I_045, I_135, dst=_get_scratch('S2', shape, np.int16),
+                          dtype=cv2.CV_16S)          # 45度差异
+        S3 = cv2.subtract(pair_45_135, pair_0_90,     # 圆偏振分量
+                          dst=_get_scratch('S3', shape, np.int16))
         
-        # 避免除零并处理NaN
-        S0 = np.where(S0 == 0, 1e-6, S0)
+        # 避免除零（全黑像素的S1/S2/S3同样为0，结果仍为0）
+        np.maximum(S0_sum, 1, out=S0_sum)
+        denom = _get_scratch('denom', shape, np.float32)
+        np.copyto(denom, S0_sum)
         
-        # 计算线偏振度 (DoLP)
-        dolp = np.clip(np.sqrt(S1**2 + S2**2) / S0, 0, 1)  # 限制在[0,1]范围内
+        # 计算偏振角 (AoLP)，转换到0-180度
+        # S1、S2为有界整数，直接查表代替逐像素的arctan2
+        idx = _get_scratch('idx', shape, np.int32)
+        np.copyto(idx, S2)
+        idx *= 511
+        idx += S1
+        idx += 255 * 511 + 255
+        aolp = np.take(_get_aolp_lut(), idx)
         
-        # 计算偏振角 (AoLP)
-        aolp = np.arctan2(S2, S1) / 2
-        # 转换到0-180度
-        aolp = np.rad2deg(aolp) + 90
+        # 计算线偏振度 (DoLP) = sqrt(S1²+S2²) / S0
+        # cv2.magnitude 单次遍历完成平方、求和与开方，cv2.divide 同时完成缩放与除法
+        S1_f = _get_scratch('S1_f', shape, np.float32)
+        S2_f = _get_scratch('S2_f', shape, np.float32)
+        np.copyto(S1_f, S1)
+        np.copyto(S2_f, S2)
+        dolp = cv2.magnitude(S1_f, S2_f)
+        cv2.divide(dolp, denom, dst=dolp, scale=2.0)
+        np.clip(dolp, 0, 1, out=dolp)  # 限制在[0,1]范围内
         
-        # 计算圆偏振度 (DoCP)（需要四分之一波片）
+        # 计算圆偏振度 (DoCP) = |S3| / (2*S0)（需要四分之一波片）
         # 注意：S3的符号决定了圆偏振的旋向（正值为右旋，负值为左旋）
-        docp = np.clip(np.abs(S3) / (2 * S0), 0, 1)
+        np.abs(S3, out=S3)
+        docp = S3.astype(np.float32)
+        cv2.divide(docp, denom, dst=docp)
+        np.clip(docp, 0, 1, out=docp)
         
         return dolp, aolp, docp
 
@@ -131,46 +376,33 @@ class ImageProcessor:
             (dolp_colored, aolp_colored, docp_colored): 颜色映射后的图像
         """
         # DoLP: 使用JET颜色映射
-        dolp_colored = cv2.applyColorMap((dolp * 255).astype(np.uint8), cv2.COLORMAP_JET)
+        # convertScaleAbs 单次遍历完成缩放与饱和转换为uint8
+        dolp_colored = cv2.applyColorMap(cv2.convertScaleAbs(dolp, alpha=255.0), cv2.COLORMAP_JET)
         
         # AoLP: 使用HSV颜色空间，角度直接映射到色调
-        aolp_normalized = (aolp / 180 * 255).astype(np.uint8)
+        aolp_normalized = cv2.convertScaleAbs(aolp, alpha=255.0 / 180.0)
         aolp_colored = cv2.applyColorMap(aolp_normalized, cv2.COLORMAP_HSV)
         
         # DoCP: 使用改进的颜色映射，区分左旋和右旋
-        # 将-1到1的范围映射到0-255
+        # 将-1到1的范围映射到查找表索引0-510，单次查表完成着色
         # 负值（左旋）映射为蓝色系
         # 正值（右旋）映射为红色系
         # 0值为白色
-        docp_abs = np.abs(docp)
-        docp_colored = np.full((*docp.shape, 3), 255, dtype=np.uint8)
-        
-        # 处理左旋（负值）
-        left_mask = docp < 0
-        intensity_left = (1 - docp_abs[left_mask]) * 255
-        docp_colored[left_mask] = np.stack([
-            np.full_like(intensity_left, 255),     # B
-            intensity_left,                        # G
-            intensity_left                         # R
-        ], axis=-1)
-        
-        # 处理右旋（正值）
-        right_mask = docp > 0
-        intensity_right = (1 - docp_abs[right_mask]) * 255
-        docp_colored[right_mask] = np.stack([
-            intensity_right,                       # B
-            intensity_right,                       # G
-            np.full_like(intensity_right, 255)    # R
-        ], axis=-1)
+        idx = (docp * 255).astype(np.int16)
+        idx += 255
+        # mode='clip' 在查表时完成越界截断，BGR三通道直接写入输出，无中间数组
+        docp_colored = np.take(_DOCP_LUT, idx, axis=0, mode='clip')
         
         return dolp_colored, aolp_colored, docp_colored
 
-    def auto_white_balance(self, image: np.ndarray, return_gains: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    def auto_white_balance(self, image: np.ndarray, return_gains: bool = False,
+                           key: Optional[Hashable] = None) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         """自动白平衡处理
         
         Args:
             image: 输入图像 (BGR格式)
             return_gains: 是否返回白平衡增益值
+            key: 白平衡上下文，见 estimate_wb_gains
             
         Returns:
             如果return_gains为False，返回处理后的图像
@@ -178,36 +410,62 @@ class ImageProcessor:
         """
         if len(image.shape) != 3:
             return (image, np.ones(3)) if return_gains else image
-            
-        # 计算每个通道的平均值
-        b, g, r = cv2.split(image)
-        b_avg = np.mean(b)
-        g_avg = np.mean(g)
-        r_avg = np.mean(r)
-        
-        # 计算增益值，以绿色通道为基准
-        if g_avg == 0:
-            gains = np.ones(3)
-        else:
-            b_gain = g_avg / b_avg if b_avg > 0 else 1.0
-            r_gain = g_avg / r_avg if r_avg > 0 else 1.0
-            gains = np.array([b_gain, 1.0, r_gain])
-            
-        # 限制增益范围
-        gains = np.clip(gains, 0.1, 3.0)
-        
-        # 保存现有的处理结果
-        result = image.copy()
-        for i in range(3):  # BGR
-            result[:, :, i] = cv2.multiply(image[:, :, i], gains[i])
+
+        gains = self.estimate_wb_gains(image, key)
+        result = self.apply_wb_gains(image, gains)
             
         return (result, gains) if return_gains else result
 
+    def estimate_wb_gains(self, image: np.ndarray, key: Optional[Hashable] = None) -> np.ndarray:
+        """估计自动白平衡增益值（以绿色通道为基准），不修改图像
+
+        Args:
+            image: 输入图像 (BGR格式)
+            key: 白平衡上下文（如某一角度、合成图）；同一上下文中场景统计量
+                变化很小时沿用上次的增益，为None时每次都重新计算
+
+        Returns:
+            np.ndarray: BGR通道的增益值数组；非三通道图像返回全1增益
+        """
+        if len(image.shape) != 3:
+            return np.ones(3)
+
+        # 在4x4抽样视图上估计通道均值，数据量减少16倍
+        avgs = image[::4, ::4].mean(axis=(0, 1))
+
+        # 同一上下文中场景统计量漂移小于阈值时沿用上次的增益
+        last_avgs, last_gains = (None, None)
+        if key is not None:
+            last_avgs, last_gains = self._last_wb.get(key, (None, None))
+        if (last_avgs is not None and last_avgs.shape == avgs.shape
+                and np.all(last_avgs > 0)
+                and np.max(np.abs(avgs - last_avgs) / last_avgs) < self._wb_drift_tolerance):
+            gains = last_gains
+        else:
+            b_avg, g_avg, r_avg = avgs[:3]
+
+            # 计算增益值，以绿色通道为基准
+            if g_avg == 0:
+                gains = np.ones(3)
+            else:
+                b_gain = g_avg / b_avg if b_avg > 0 else 1.0
+                r_gain = g_avg / r_avg if r_avg > 0 else 1.0
+                gains = np.array([b_gain, 1.0, r_gain])
+
+            # 限制增益范围
+            gains = np.clip(gains, 0.1, 3.0)
+            if key is not None:
+                # 整体替换：并发读取同一上下文时均值与增益总是配对的
+                self._last_wb[key] = (avgs, gains)
+
+        return gains
+
     def enhance_image(self, image: np.ndarray, 
                      brightness: float = 1.0,
                      contrast: float = 1.0,
                      sharpness: float = 0.0,
-                     denoise: float = 0.0) -> np.ndarray:
+                     denoise: float = 0.0,
+                     wb_gains: np.ndarray = None) -> np.ndarray:
         """应用图像增强
         
         Args:
@@ -216,15 +474,29 @@ class ImageProcessor:
             contrast: 对比度调节因子 (0.0-2.0)
             sharpness: 锐化强度 (0.0-1.0)
             denoise: 降噪强度 (0.0-1.0)
+            wb_gains: 可选的BGR白平衡增益，在亮度/对比度调节之前应用；
+                uint8彩色图像的白平衡与亮度/对比度合并为一次查表
             
         Returns:
-            np.ndarray: 增强后的图像
+            np.ndarray: 增强后的图像；未启用任何增强时直接返回输入图像本身（共享缓冲区）
         """
         try:
-            result = image.copy()
+            # 各OpenCV操作均输出到新缓冲区，无需预先复制输入
+            result = image
+            adjust = brightness != 1.0 or contrast != 1.0
+
+            # 白平衡：uint8彩色图像的白平衡与亮度/对比度都是逐通道的点运算，
+            # 合成一张查找表后单次遍历完成
+            if wb_gains is not None and len(image.shape) == 3:
+                if image.dtype == np.uint8:
+                    result = cv2.LUT(image, self._get_wb_lut(
+                        wb_gains, brightness if adjust else 1.0, contrast if adjust else 1.0))
+                    adjust = False
+                else:
+                    result = self.apply_wb_gains(image, wb_gains)
             
             # 亮度和对比度调节
-            if brightness != 1.0 or contrast != 1.0:
+            if adjust:
                 result = cv2.convertScaleAbs(
                     result, 
                     alpha=contrast,
@@ -233,11 +505,22 @@ class ImageProcessor:
             
             # 锐化处理
             if sharpness > 0:
-                kernel = np.array([[-1,-1,-1], [-1,9,-1], [-1,-1,-1]]) * sharpness
-                result = cv2.filter2D(result, -1, kernel)
+                kernel = _sharpen_kernel(float(sharpness))
+                if result is image:
+                    result = cv2.filter2D(result, -1, kernel)
+                else:
+                    # 结果缓冲区已是本函数新分配的，可原地滤波
+                    cv2.filter2D(result, -1, kernel, dst=result)
             
-            # 降噪处理
-            if denoise > 0:
+            # 降噪处理：有可用CUDA设备时在GPU上执行，失败则回退到CPU
+            denoised = False
+            if denoise > 0 and result.dtype == np.uint8 and _cuda_available():
+                try:
+                    result = _denoise_cuda(result, denoise * 10)
+                    denoised = True
+                except cv2.error as e:
+                    self._logger.warning(f"GPU降噪失败，回退到CPU: {str(e)}")
+            if denoise > 0 and not denoised:
                 if len(result.shape) == 3:
                     result = cv2.fastNlMeansDenoisingColored(
                         result, None,
@@ -254,6 +537,9 @@ class ImageProcessor:
             
         except Exception as e:
             self._logger.error(f"图像增强失败: {str(e)}")
+            # 增强失败时仍保证白平衡生效
+            if wb_gains is not None:
+                return self.apply_wb_gains(image, wb_gains)
             return image
 
     def apply_wb_gains(self, image: np.ndarray, gains: np.ndarray) -> np.ndarray:
@@ -269,7 +555,33 @@ class ImageProcessor:
         if len(image.shape) != 3:
             return image
             
-        result = image.copy()
-        for i in range(3):  # BGR
-            result[:, :, i] = cv2.multiply(image[:, :, i], gains[i])
-        return result
+        if image.dtype == np.uint8:
+            # uint8 每通道只有256种取值，查表代替逐像素浮点乘法
+            return cv2.LUT(image, self._get_wb_lut(gains))
+            
+        # 对角矩阵变换：单次遍历完成BGR三通道的饱和乘法
+        return cv2.transform(image, np.diag(gains).astype(np.float32))
+
+    def _get_wb_lut(self, gains: np.ndarray, brightness: float = 1.0,
+                    contrast: float = 1.0) -> np.ndarray:
+        """获取（必要时构建）白平衡增益对应的三通道查找表
+
+        亮度/对比度不为默认值时，查找表在白平衡之后再合成亮度/对比度调节，
+        结果与先白平衡、再 cv2.convertScaleAbs 逐像素处理完全一致
+        """
+        key = (tuple(float(g) for g in gains), float(brightness), float(contrast))
+        with self._wb_luts_lock:
+            lut = self._wb_luts.get(key)
+        if lut is None:
+            # 与 cv2.transform 一致：float32 乘法后四舍五入并饱和到 [0, 255]
+            values = np.arange(256, dtype=np.float32)[:, None] * np.asarray(gains, dtype=np.float32)
+            lut = np.clip(np.rint(values), 0, 255).astype(np.uint8).reshape(256, 1, 3)
+            if brightness != 1.0 or contrast != 1.0:
+                # 对查找表本身做同样的调节，保证与逐像素调节的舍入一致
+                lut = cv2.convertScaleAbs(lut, alpha=contrast, beta=brightness * 255)
+            # 多个线程可能同时为不同角度构建查找表，插入与淘汰需加锁
+            with self._wb_luts_lock:
+                if len(self._wb_luts) >= self._max_wb_luts:
+                    self._wb_luts.pop(next(iter(self._wb_luts)), None)
+                self._wb_luts[key] = lut
+        return lut
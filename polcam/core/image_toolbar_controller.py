@@ -6,14 +6,33 @@ See LICENSE file for full license details.
 
 from .base_module import BaseModule
 from typing import Optional, List
-from qtpy import QtWidgets
-from .events import Event, EventType
+from qtpy import QtCore
+from .events import EventType
 
 class ImageToolbarController(BaseModule):
     """图像工具栏控制器"""
 
     ZOOM_FACTOR = 1.5  # 放大/缩小倍率
     MAX_ZOOM = 100.0   # 最大放大倍率
+    STATUS_INTERVAL_MS = 33  # 高频状态栏消息刷新间隔（约30Hz）
+
+    # 显示模式文本 -> 四分图标题
+    _QUAD_TITLES = {
+        "四角度彩色": ('0°', '45°', '90°', '135°'),
+        "四角度灰度": ('0°', '45°', '90°', '135°'),
+        "偏振度图像": ('合成图', 'DOLP', 'AOLP', 'DOCP'),
+    }
+    _DEFAULT_QUAD_TITLES = ('区域1', '区域2', '区域3', '区域4')
+
+    # 游标状态栏数值格式模板
+    _FMT_RGB = "%s:RGB(%d,%d,%d)"
+    _FMT_GRAY = "%s:%d"
+    _FMT_POL = "%s:%.3f"
+    # 整行状态文本模板，一次格式化生成完整字符串
+    _STATUS_FMT_RGB = "(%d, %d) || RGB: (%d, %d, %d)"
+    _STATUS_FMT_GRAY = "(%d, %d) || 灰度: %s"
+    _STATUS_FMT_EMPTY = "(%d, %d) || "
+    _STATUS_FMT_QUAD = "(%d, %d) || %s"
 
     def __init__(self, toolbar, image_display=None):
         super().__init__("ImageToolbarController")
@@ -22,6 +41,19 @@ class ImageToolbarController(BaseModule):
         self._cursor_mode = False
         self._zoom_mode = None  # 'zoom_in' | 'zoom_out' | 'zoom_area' | None
         self._camera_module = None
+        self._quad_titles_cache = self._DEFAULT_QUAD_TITLES
+        # 本控制器建立的信号连接，非空表示已连接，防止重复初始化导致槽函数重复触发
+        self._connections: List[QtCore.QMetaObject.Connection] = []
+        self._cursor_connection = None  # 游标位置信号仅在游标模式下连接
+
+        # 状态消息合并定时器：高频鼠标移动时只发布最新一条
+        self._pending_status = None
+        self._pending_cursor_info = None  # 最近一次游标信息，发布时才格式化
+        self._last_status = None  # 最近一次由定时器发布的消息，用于去重
+        self._status_timer = QtCore.QTimer()
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.STATUS_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_status)
 
     def set_camera_module(self, camera_module):
         """设置相机模块引用，用于 ROI 控制
@@ -34,22 +66,33 @@ class ImageToolbarController(BaseModule):
     def _do_initialize(self) -> bool:
         """初始化工具栏控制器"""
         try:
-            # 连接工具栏信号
-            self.toolbar.cursorModeActivated.connect(self._handle_cursor_mode)
-            self.toolbar.zoomInActivated.connect(self._handle_zoom_in)
-            self.toolbar.zoomOutActivated.connect(self._handle_zoom_out)
-            self.toolbar.zoomAreaActivated.connect(self._handle_zoom_area)
-            self.toolbar.resetView.connect(self._handle_reset_view)
-
-            if self.image_display:
-                self.image_display.cursorPositionChanged.connect(self._handle_cursor_position)
-                # 连接缩放交互信号
-                self.image_display.zoomClickRequested.connect(self._handle_zoom_click)
-                self.image_display.zoomAreaRequested.connect(self._handle_zoom_area_selection)
-                self.image_display.zoomAreaPreview.connect(self._handle_zoom_area_preview)
+            # 连接工具栏信号（已连接时跳过，避免重复连接）
+            if not self._connections:
+                connections = [
+                    self.toolbar.cursorModeActivated.connect(self._handle_cursor_mode),
+                    self.toolbar.zoomInActivated.connect(self._handle_zoom_in),
+                    self.toolbar.zoomOutActivated.connect(self._handle_zoom_out),
+                    self.toolbar.zoomAreaActivated.connect(self._handle_zoom_area),
+                    self.toolbar.resetView.connect(self._handle_reset_view),
+                ]
+
+                if self.image_display:
+                    # 连接缩放交互信号（游标位置信号在开启游标模式时才连接）
+                    connections += [
+                        self.image_display.zoomClickRequested.connect(self._handle_zoom_click),
+                        self.image_display.zoomAreaRequested.connect(self._handle_zoom_area_selection),
+                        self.image_display.zoomAreaPreview.connect(self._handle_zoom_area_preview),
+                        # 显示模式变化时刷新四分图标题缓存，避免游标热路径反复查询控件
+                        self.image_display.display_mode.currentTextChanged.connect(
+                            self._on_display_mode_changed),
+                    ]
+                    self._on_display_mode_changed(
+                        self.image_display.display_mode.currentText())
+                self._connections = connections
 
             # 初始化时确保所有模式都是关闭状态
             self._cursor_mode = False
+            self._set_cursor_signal_connected(False)
             if self.image_display:
                 self.image_display.set_cursor_mode(False)
 
@@ -65,101 +108,147 @@ class ImageToolbarController(BaseModule):
         return True
 
     def _do_destroy(self) -> bool:
-        # 断开所有信号连接
-        try:
-            self.toolbar.cursorModeActivated.disconnect()
-            self.toolbar.zoomInActivated.disconnect()
-            self.toolbar.zoomOutActivated.disconnect()
-            self.toolbar.zoomAreaActivated.disconnect()
-            return True
-        except:
-            return False
+        # 逐个断开本控制器建立的连接，不影响其他对象的连接
+        self._status_timer.stop()
+        self._set_cursor_signal_connected(False)
+        for connection in self._connections:
+            QtCore.QObject.disconnect(connection)
+        self._connections.clear()
+        return True
 
     def _show_status_message(self, message: str):
         """发送状态栏消息更新事件"""
+        self._cancel_pending_status()
+        self._last_status = None
         self.publish_event(EventType.STATUS_MESSAGE_UPDATE, {
             'message': message
         })
 
     def _clear_status_message(self):
         """发送状态栏消息清除事件"""
+        self._cancel_pending_status()
+        self._last_status = None
         self.publish_event(EventType.STATUS_MESSAGE_CLEAR)
 
-    def _handle_cursor_position(self, info: dict):
-        """处理游标位置变化"""
-        if not self._cursor_mode:
+    def _queue_status_message(self, message: str):
+        """缓存高频状态消息（游标、选区预览），由定时器合并后发布"""
+        self._pending_status = message
+        self._pending_cursor_info = None
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _cancel_pending_status(self):
+        """丢弃尚未发布的合并消息，避免其覆盖随后直接发布的消息"""
+        self._status_timer.stop()
+        self._pending_status = None
+        self._pending_cursor_info = None
+
+    def _flush_status(self):
+        """发布最近一次缓存的状态消息"""
+        message = self._pending_status
+        info = self._pending_cursor_info
+        self._pending_status = None
+        self._pending_cursor_info = None
+        if info is not None and self._cursor_mode:
+            # 游标信息只在定时器触发时格式化一次，期间的中间位置直接丢弃
+            message = self._format_cursor_status(info)
+        # 平坦区域内移动时文本常保持不变，相同消息不再重复发布
+        if message is not None and message != self._last_status:
+            self._last_status = message
+            self.publish_event(EventType.STATUS_MESSAGE_UPDATE, {
+                'message': message
+            })
+
+    def _set_cursor_signal_connected(self, connected: bool):
+        """连接或断开游标位置信号，游标模式关闭时鼠标移动不再触发槽函数"""
+        if not self.image_display or connected == (self._cursor_connection is not None):
             return
+        if connected:
+            self._cursor_connection = self.image_display.cursorPositionChanged.connect(
+                self._handle_cursor_position)
+        else:
+            QtCore.QObject.disconnect(self._cursor_connection)
+            self._cursor_connection = None
 
-        try:
+    def _handle_cursor_position(self, info: dict):
+        """处理游标位置变化（仅在游标模式下连接）"""
+        # 仅记录最新游标信息，格式化推迟到合并定时器触发时
+        self._pending_cursor_info = info
+        self._pending_status = None
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _format_cursor_status(self, info: dict) -> Optional[str]:
+        """将游标信息格式化为状态栏文本
+
+        Returns:
+            状态栏文本；游标不在有效分图内时返回 None
+        """
+        # 各字段只查询一次并绑定到局部变量，后续按局部变量分支
+        info_get = info.get
+        if info['mode'] != 'quad':
+            # 单图模式
             x, y = info['position']
-            mode = info['mode']
-            quad_index = info.get('quad_index')
-
-            if mode == 'quad':
-                # 四分图模式
-                cursor_quad_position = info.get('cursor_quad_position')
-                if cursor_quad_position and quad_index is not None:
-                    rel_x, rel_y = cursor_quad_position
-                    # 获取分图标题列表
-                    quad_titles = self._get_quad_titles(info)
-
-                    # 确保quad_index在有效范围内
-                    if 0 <= quad_index < len(quad_titles):
-                        position_text = f"({rel_x}, {rel_y})"
-                        # 获取所有区域的像素值/数值
-                        values_text = []
-                        pixel_text = ""
-                        if 'quad_rgb_values' in info:
-                            for i, (r, g, b) in enumerate(info['quad_rgb_values']):
-                                if i < len(quad_titles):
-                                    values_text.append(f"{quad_titles[i]}:RGB({r},{g},{b})")
-                        elif 'quad_gray_values' in info:
-                            for i, gray in enumerate(info['quad_gray_values']):
-                                if i < len(quad_titles):
-                                    values_text.append(f"{quad_titles[i]}:{gray}")
-                        elif 'quad_pol_values' in info:
-                            for i, value in enumerate(info['quad_pol_values']):
-                                if i < len(quad_titles):
-                                    if i == 0:
-                                        if isinstance(value, tuple):
-                                            r, g, b = value
-                                            values_text.append(f"{quad_titles[i]}:RGB({r},{g},{b})")
-                                        else:
-                                            values_text.append(f"{quad_titles[i]}:{int(value)}")
-                                    else:
-                                        values_text.append(f"{quad_titles[i]}:{value:.3f}")
-                        pixel_text = " | ".join(values_text)
-
-                        status_text = f"{position_text} || {pixel_text}"
-                        self._show_status_message(status_text)
+            rgb = info_get('rgb')
+            if rgb is not None:
+                r, g, b = rgb
+                return self._STATUS_FMT_RGB % (x, y, r, g, b)
+            gray = info_get('gray')
+            if gray is not None:
+                return self._STATUS_FMT_GRAY % (x, y, gray)
+            return self._STATUS_FMT_EMPTY % (x, y)
+
+        # 四分图模式
+        quad_index = info['quad_index']
+        cursor_quad_position = info['cursor_quad_position']
+        if not cursor_quad_position or quad_index is None:
+            return None
+
+        # 获取分图标题列表，确保quad_index在有效范围内
+        quad_titles = self._quad_titles_cache
+        if not 0 <= quad_index < len(quad_titles):
+            return None
+
+        # 获取所有区域的像素值/数值，zip 按标题数量截断
+        quad_rgb = info_get('quad_rgb_values')
+        quad_gray = info_get('quad_gray_values')
+        quad_pol = info_get('quad_pol_values')
+        if quad_rgb is not None:
+            fmt_rgb = self._FMT_RGB
+            pixel_text = " | ".join([fmt_rgb % (title, r, g, b)
+                                     for title, (r, g, b) in zip(quad_titles, quad_rgb)])
+        elif quad_gray is not None:
+            fmt_gray = self._FMT_GRAY
+            pixel_text = " | ".join([fmt_gray % (title, gray)
+                                     for title, gray in zip(quad_titles, quad_gray)])
+        elif quad_pol:
+            # 固定结构：首项为合成图（RGB元组或灰度），其余为偏振参数
+            v0 = quad_pol[0]
+            if type(v0) is tuple:
+                head = self._FMT_RGB % (quad_titles[0], *v0)
             else:
-                # 单图模式
-                position_text = f"({x}, {y})"
-                if 'rgb' in info:
-                    r, g, b = info['rgb']
-                    pixel_text = f"RGB: ({r}, {g}, {b})"
-                elif 'gray' in info:
-                    gray = info['gray']
-                    pixel_text = f"灰度: {gray}"
-                else:
-                    pixel_text = ""
+                head = self._FMT_GRAY % (quad_titles[0], int(v0))
+            fmt_pol = self._FMT_POL
+            pixel_text = " | ".join([head] + [fmt_pol % item
+                                              for item in zip(quad_titles[1:], quad_pol[1:])])
+        else:
+            pixel_text = ""
 
-                status_text = f"{position_text} || {pixel_text}"
-                self._show_status_message(status_text)
-
-        except Exception as e:
-            self._logger.error(f"处理游标位置失败: {str(e)}")
+        rel_x, rel_y = cursor_quad_position
+        return self._STATUS_FMT_QUAD % (rel_x, rel_y, pixel_text)
 
     def _handle_cursor_mode(self, enabled: bool):
         """处理游标模式"""
         if enabled:
             self._cursor_mode = True
             self._zoom_mode = None
+            self._set_cursor_signal_connected(True)
             if self.image_display:
                 self.image_display.set_interaction_mode('cursor')
             self._show_status_message("游标模式已开启")
         else:
             self._cursor_mode = False
+            self._set_cursor_signal_connected(False)
             if self.image_display:
                 self.image_display.set_interaction_mode('none')
                 self.image_display.refresh_current_image()
@@ -172,6 +261,7 @@ class ImageToolbarController(BaseModule):
         if enabled:
             self._zoom_mode = 'zoom_in'
             self._cursor_mode = False
+            self._set_cursor_signal_connected(False)
             if self.image_display:
                 self.image_display.set_interaction_mode('zoom_in')
             self._show_status_message("放大模式：点击图像进行放大")
@@ -186,6 +276,7 @@ class ImageToolbarController(BaseModule):
         if enabled:
             self._zoom_mode = 'zoom_out'
             self._cursor_mode = False
+            self._set_cursor_signal_connected(False)
             if self.image_display:
                 self.image_display.set_interaction_mode('zoom_out')
             self._show_status_message("缩小模式：点击图像进行缩小")
@@ -200,6 +291,7 @@ class ImageToolbarController(BaseModule):
         if enabled:
             self._zoom_mode = 'zoom_area'
             self._cursor_mode = False
+            self._set_cursor_signal_connected(False)
             if self.image_display:
                 self.image_display.set_interaction_mode('zoom_area')
             self._show_status_message("区域放大模式：拖拽选择放大区域")
@@ -317,7 +409,7 @@ class ImageToolbarController(BaseModule):
     def _handle_zoom_area_preview(self, sensor_x: int, sensor_y: int,
                                    width: int, height: int):
         """处理区域放大拖拽时的实时预览"""
-        self._show_status_message(
+        self._queue_status_message(
             f"选区: ({sensor_x}, {sensor_y}) {width}x{height}"
         )
 
@@ -328,21 +420,7 @@ class ImageToolbarController(BaseModule):
             sensor = self._camera_module.get_sensor_size()
             self.image_display.update_roi_info(roi, sensor)
 
-    def _get_quad_titles(self, info: dict) -> List[str]:
-        """根据不同的四分图模式返回对应的标题列表"""
-        mode = info.get('mode')
-        if not mode == 'quad':
-            return []
-
-        # 从ImageDisplay的当前显示模式获取
-        if self.image_display:
-            current_mode = self.image_display.display_mode.currentText()
-
-            # 根据显示模式返回对应的标题
-            if current_mode in ["四角度彩色", "四角度灰度"]:
-                return ['0°', '45°', '90°', '135°']
-            elif current_mode == "偏振度图像":
-                return ['合成图', 'DOLP', 'AOLP', 'DOCP']
-
-        # 默认返回通用标题
-        return ['区域1', '区域2', '区域3', '区域4']
+    def _on_display_mode_changed(self, text: str):
+        """显示模式变化时更新四分图标题缓存"""
+        self._quad_titles_cache = self._QUAD_TITLES.get(
+            text, self._DEFAULT_QUAD_TITLES)
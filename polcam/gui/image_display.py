@@ -71,6 +71,12 @@ class ImageDisplay(QtWidgets.QWidget):
         self._current_roi = None            # 当前 ROI: (offset_x, offset_y, width, height)
         self._sensor_size = None            # 传感器尺寸: (width, height)
         self._rubber_band_clamp_rect = None # QRect: 四分图模式下橡皮筋的显示空间钳位边界
+        # 游标模式鼠标移动合并：只记录最新位置，事件循环空闲时处理一次
+        self._pending_mouse_pos = None
+        self._mouse_move_timer = QtCore.QTimer(self)
+        self._mouse_move_timer.setSingleShot(True)
+        self._mouse_move_timer.setInterval(0)
+        self._mouse_move_timer.timeout.connect(self._process_mouse_move)
 
         self.setup_ui()
         # 初始化时禁用控件
@@ -152,6 +158,8 @@ class ImageDisplay(QtWidgets.QWidget):
         self.display_mode.addItems([MODE_LABELS[m] for m in modes])
         self.display_mode.setCurrentIndex(0)
         self.display_mode.blockSignals(False)
+        # 填充期间信号被屏蔽，补发文本变化以同步依赖显示模式文本的缓存
+        self.display_mode.currentTextChanged.emit(self.display_mode.currentText())
 
     def set_camera_modes(self, camera_type=None):
         """根据相机类型更新可用显示模式列表
@@ -277,8 +285,8 @@ class ImageDisplay(QtWidgets.QWidget):
         self.current_images = [img.copy() for img in images if img is not None]
         
         if gray:
+            # 灰度图由画布绘制时直接广播为三通道
             images = [self.to_grayscale(img) for img in images]
-            images = [cv2.cvtColor(img, cv2.COLOR_GRAY2BGR) for img in images]
                 
         titles = ['0 deg', '45 deg', '90 deg', '135 deg']
         canvas, self.quad_positions, self.quad_size = ImagePlotter.create_quad_canvas(images, titles)
@@ -590,8 +598,20 @@ class ImageDisplay(QtWidgets.QWidget):
             self._rubber_band_clamp_rect = None
             
     def _on_mouse_move(self, event: QtGui.QMouseEvent):
-        """处理鼠标移动事件"""
-        if not self.cursor_enabled or not self.current_images:  # 修改判断条件
+        """处理鼠标移动事件
+
+        只记录最新位置，由零间隔单次定时器在事件循环下一轮统一处理，
+        快速拖动时连续的鼠标事件合并为一次像素读取与游标重绘
+        """
+        self._pending_mouse_pos = (event.x(), event.y())
+        if not self._mouse_move_timer.isActive():
+            self._mouse_move_timer.start()
+
+    def _process_mouse_move(self):
+        """处理合并后的最新鼠标位置"""
+        pos = self._pending_mouse_pos
+        self._pending_mouse_pos = None
+        if pos is None or not self.cursor_enabled or not self.current_images:
             return
             
         # 获取图像实际显示区域
@@ -618,8 +638,8 @@ class ImageDisplay(QtWidgets.QWidget):
             y_offset = (label_size.height() - display_height) / 2
             
         # 计算鼠标在图像上的实际位置
-        mouse_x = event.x() - x_offset
-        mouse_y = event.y() - y_offset
+        mouse_x = pos[0] - x_offset
+        mouse_y = pos[1] - y_offset
         
         if (mouse_x < 0 or mouse_x >= display_width or 
             mouse_y < 0 or mouse_y >= display_height):
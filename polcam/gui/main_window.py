@@ -367,6 +367,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self._update_process_time(proc_time)
             # 只在非连续采集模式下启用保存处理结果按钮
             self.toolbar_controller.enable_save_result(not self._continuous_mode)
+        # 帧处理事件同时表示本次处理完成
+        self._on_processing_completed(event)
 
     def _on_processing_started(self, event: Event):
         """处理开始时的处理"""
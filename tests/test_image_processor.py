@@ -7,7 +7,9 @@ See LICENSE file for full license details.
 import numpy as np
 import pytest
 import cv2
-from polcam.core.image_processor import ImageProcessor
+import polanalyser as pa
+from concurrent.futures import ThreadPoolExecutor
+from polcam.core.image_processor import ImageProcessor, _demosaic_polar_rgb
 
 @pytest.fixture
 def image_processor():
@@ -279,3 +281,126 @@ def test_calculate_polarization_parameters_edge_cases():
     white_images = [np.full((2, 2), 255, dtype=np.uint8) for _ in range(4)]
     dolp_white, _, _ = ImageProcessor.calculate_polarization_parameters(white_images)
     assert np.all(dolp_white >= 0) and np.all(dolp_white <= 1)
+
+def test_calculate_polarization_parameters_precision():
+    """测试偏振参数计算 - 高亮度下不溢出且输出为float32"""
+    # 完全水平线偏振：I0=250, I90=0, I45=I135=125
+    I_000 = np.full((2, 2), 250, dtype=np.uint8)
+    I_045 = np.full((2, 2), 125, dtype=np.uint8)
+    I_090 = np.zeros((2, 2), dtype=np.uint8)
+    I_135 = np.full((2, 2), 125, dtype=np.uint8)
+
+    dolp, aolp, docp = ImageProcessor.calculate_polarization_parameters(
+        [I_000, I_045, I_090, I_135])
+
+    for param in (dolp, aolp, docp):
+        assert param.dtype == np.float32
+    assert np.allclose(dolp, 1.0)
+    assert np.allclose(aolp, 90.0)
+    assert np.allclose(docp, 0.0)
+
+def test_calculate_polarization_parameters_gray_block(polarization_images):
+    """测试偏振参数计算 - (4, H, W) 灰度块输入与图像列表结果一致"""
+    h, w = polarization_images[0].shape[:2]
+    block = ImageProcessor.to_grayscale(
+        polarization_images, out=np.empty((4, h, w), dtype=np.uint8))
+    assert block.shape == (4, h, w)
+
+    expected = ImageProcessor.calculate_polarization_parameters(polarization_images)
+    result = ImageProcessor.calculate_polarization_parameters(block)
+    # float32 运算的SIMD路径随缓冲区对齐不同，末位舍入可能相差1个ulp
+    for exp, res in zip(expected, result):
+        np.testing.assert_allclose(exp, res, rtol=1e-6, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        ImageProcessor.calculate_polarization_parameters(block[:3])
+
+def test_apply_wb_gains(image_processor):
+    """测试白平衡增益应用 - 查表结果与逐像素乘法一致"""
+    image = np.random.randint(0, 256, (50, 60, 3), dtype=np.uint8)
+    gains = np.array([1.5, 1.0, 0.5])
+
+    balanced = image_processor.apply_wb_gains(image, gains)
+    expected = np.clip(np.rint(image * gains.astype(np.float32)), 0, 255).astype(np.uint8)
+
+    assert balanced.dtype == np.uint8
+    assert np.array_equal(balanced, expected)
+
+    # 灰度图像原样返回
+    gray = image[:, :, 0]
+    assert image_processor.apply_wb_gains(gray, gains) is gray
+
+def test_enhance_image_fused_wb(image_processor):
+    """测试白平衡与亮度/对比度合并查表 - 结果与分步处理一致"""
+    image = np.random.randint(0, 256, (50, 60, 3), dtype=np.uint8)
+    gains = np.array([1.5, 1.0, 0.5])
+
+    for brightness, contrast in [(1.0, 1.0), (0.2, 1.3), (0.0, 0.8)]:
+        expected = image_processor.enhance_image(
+            image_processor.apply_wb_gains(image, gains),
+            brightness=brightness, contrast=contrast)
+        fused = image_processor.enhance_image(
+            image, brightness=brightness, contrast=contrast, wb_gains=gains)
+        assert np.array_equal(fused, expected)
+
+def test_demosaic_polarization_fast(image_processor):
+    """测试实时采集解码入口 - 结果与验证入口一致，签名变化时重新验证"""
+    raw_image = np.random.randint(0, 256, (8, 8), dtype=np.uint8)
+
+    for _ in range(2):  # 第二次调用命中已验证的签名
+        fast_images = image_processor.demosaic_polarization_fast(raw_image)
+        for fast, ref in zip(fast_images, ImageProcessor.demosaic_polarization(raw_image)):
+            assert np.array_equal(fast, ref)
+
+    with pytest.raises(ValueError):
+        image_processor.demosaic_polarization_fast(np.zeros((6, 6), dtype=np.uint8))
+
+def test_estimate_wb_gains_per_context(image_processor):
+    """测试白平衡增益复用按上下文区分 - 相近的不同图像各自计算增益"""
+    image_a = np.full((40, 40, 3), 100, dtype=np.uint8)
+    image_b = image_a.copy()
+    image_b[:20, :, 0] = 101  # 通道均值相差1%以内，但增益不同
+    expected_b = np.array([100 / 100.5, 1.0, 1.0])
+
+    gains_a = image_processor.estimate_wb_gains(image_a, key=('quad', 0))
+    gains_b = image_processor.estimate_wb_gains(image_b, key=('quad', 45))
+    assert np.allclose(gains_a, [1.0, 1.0, 1.0])
+    assert np.allclose(gains_b, expected_b)
+
+    # 不指定上下文时每次都重新计算
+    image_processor.estimate_wb_gains(image_a)
+    assert np.allclose(image_processor.estimate_wb_gains(image_b), expected_b)
+
+    # 同一上下文中统计量变化很小时沿用上次的增益
+    assert image_processor.estimate_wb_gains(image_b, key=('quad', 0)) is gains_a
+
+def test_estimate_wb_gains_concurrent_contexts(image_processor):
+    """测试各角度并行估计白平衡增益 - 结果与各自单独计算一致"""
+    images = []
+    for i in range(4):
+        img = np.full((40, 40, 3), 100, dtype=np.uint8)
+        img[:, :, 0] = 100 + i  # 相邻角度的通道均值相差1%以内
+        images.append(img)
+    expected = [ImageProcessor().estimate_wb_gains(img) for img in images]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for _ in range(20):
+            gains = list(pool.map(
+                lambda i: image_processor.estimate_wb_gains(images[i], ('quad', i * 45)),
+                range(4)))
+            for g, e in zip(gains, expected):
+                assert np.allclose(g, e)
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+@pytest.mark.parametrize("shape", [(8, 8), (64, 96)])
+def test_demosaic_polar_rgb_matches_polanalyser(dtype, shape):
+    """测试并行彩色偏振解码 - 与 pa.COLOR_PolarRGB_EA 逐位一致"""
+    rng = np.random.default_rng(0)
+    raw_image = rng.integers(0, np.iinfo(dtype).max, shape, dtype=dtype, endpoint=True)
+
+    expected = pa.demosaicing(raw_image, pa.COLOR_PolarRGB_EA)
+    result = _demosaic_polar_rgb(raw_image)
+    assert len(result) == len(expected)
+    for img, ref in zip(result, expected):
+        assert img.dtype == ref.dtype
+        assert np.array_equal(img, ref)
@@ -0,0 +1,246 @@
+"""
+MIT License
+Copyright (c) 2024 Junhao Cai
+See LICENSE file for full license details.
+"""
+
+import pytest
+import threading
+import time
+import numpy as np
+import cv2
+from polcam.core.events import EventType
+from polcam.core.image_processor import ImageProcessor
+from polcam.core.processing_module import (
+    ProcessingModule, ProcessingMode, ProcessingResult, ProcessingTask, _TaskQueue
+)
+
+@pytest.fixture
+def processing_module():
+    """创建并启动处理模块，测试结束后停止并销毁"""
+    module = ProcessingModule()
+    assert module.initialize()
+    assert module.start()
+    yield module
+    module.stop()
+    module.destroy()
+
+def _make_task(priority=0):
+    """创建只用于队列测试的任务"""
+    frame = np.zeros((4, 4), dtype=np.uint8)
+    return ProcessingTask(frame=frame, mode=ProcessingMode.RAW,
+                          params={}, priority=priority)
+
+def test_task_queue_priority():
+    """测试高优先级任务先于普通任务出队"""
+    queue = _TaskQueue()
+    normal = _make_task()
+    high = _make_task(priority=10)
+    queue.put(normal)
+    queue.put(high)
+
+    assert queue.qsize() == 2
+    assert queue.get() is high
+    assert queue.get() is normal
+    assert queue.empty()
+
+def test_task_queue_latest_only():
+    """测试积压上限为1时新帧覆盖尚未处理的旧帧，高优先级任务不受影响"""
+    queue = _TaskQueue(max_pending=1)
+    tasks = [_make_task() for _ in range(3)]
+    high = _make_task(priority=10)
+    for task in tasks:
+        queue.put(task)
+    queue.put(high)
+
+    assert queue.qsize() == 2
+    assert queue.get() is high
+    assert queue.get() is tasks[-1]
+    assert queue.empty()
+
+def test_task_queue_clear():
+    """测试清空两类待处理任务"""
+    queue = _TaskQueue()
+    queue.put(_make_task())
+    queue.put(_make_task(priority=10))
+    queue.clear()
+
+    assert queue.empty()
+    assert queue.qsize() == 0
+
+def test_task_queue_close_wakes_consumer():
+    """测试关闭队列唤醒阻塞的消费者并返回None"""
+    queue = _TaskQueue()
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(queue.get()))
+    consumer.start()
+
+    # 消费者在空队列上阻塞
+    consumer.join(timeout=0.1)
+    assert consumer.is_alive()
+
+    queue.close()
+    consumer.join(timeout=1.0)
+    assert not consumer.is_alive()
+    assert results == [None]
+
+    # 关闭后即使有任务也不再出队，重新打开后恢复
+    task = _make_task()
+    queue.put(task)
+    assert queue.get() is None
+    queue.reopen()
+    assert queue.get() is task
+
+def _wait_until(condition, timeout=2.0):
+    """轮询等待条件成立"""
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def test_ordered_publishing_drops_stale_results(processing_module):
+    """测试多线程处理时结果按序号发布，晚完成的旧任务结果被丢弃"""
+    frame = np.zeros((4, 4), dtype=np.uint8)
+    started = {seq: threading.Event() for seq in range(3)}
+    release = {seq: threading.Event() for seq in range(3)}
+    published = []
+
+    def fake_process_task(task):
+        started[task.seq].set()
+        release[task.seq].wait(timeout=2.0)
+        return ProcessingResult(mode=ProcessingMode.RAW, images=[task.frame],
+                                metadata={'seq': task.seq}, timestamp=time.time())
+
+    def record_event(event_type, data=None):
+        published.append((event_type, data))
+
+    processing_module._process_task = fake_process_task
+    processing_module.publish_event = record_event
+
+    def published_seqs():
+        return [data['result'].metadata['seq'] for event_type, data in list(published)
+                if event_type == EventType.FRAME_PROCESSED]
+
+    def completed_count():
+        return sum(1 for event_type, _ in list(published)
+                   if event_type == EventType.PROCESSING_COMPLETED)
+
+    # 两个处理线程各取到一个任务，任务0先入队但后完成
+    processing_module.process_frame(frame)
+    assert started[0].wait(timeout=2.0)
+    processing_module.process_frame(frame)
+    assert started[1].wait(timeout=2.0)
+
+    release[1].set()
+    assert _wait_until(lambda: published_seqs() == [1])
+
+    # 任务0的结果已过期，不发布帧处理事件，只通知处理结束
+    release[0].set()
+    assert _wait_until(lambda: completed_count() == 1)
+    assert published_seqs() == [1]
+
+    # 之后的新任务照常发布
+    processing_module.process_frame(frame)
+    assert started[2].wait(timeout=2.0)
+    release[2].set()
+    assert _wait_until(lambda: published_seqs() == [1, 2])
+    assert completed_count() == 1
+
+def _make_cache_task(module, frame, mode=ProcessingMode.QUAD_GRAY):
+    """按处理模块当前参数创建任务，与 process_frame 一致"""
+    return ProcessingTask(frame=frame, mode=mode,
+                          params=module._params_snapshot,
+                          params_version=module._params_version)
+
+def _make_result(mode=ProcessingMode.QUAD_GRAY):
+    return ProcessingResult(mode=mode, images=[], metadata={}, timestamp=time.time())
+
+def test_cache_lru_refresh_and_eviction():
+    """测试缓存命中后刷新LRU顺序，超出上限时淘汰最久未使用的项"""
+    module = ProcessingModule()
+    module.set_cache_size(2)
+    frames = [np.full((8, 8), value, dtype=np.uint8) for value in (0, 1, 2)]
+    tasks = [_make_cache_task(module, frame) for frame in frames]
+    results = [_make_result() for _ in frames]
+    keys = [module._get_cache_key(task) for task in tasks]
+
+    module._update_cache(tasks[0], results[0])
+    module._update_cache(tasks[1], results[1])
+    assert list(module._frame_cache) == [keys[0], keys[1]]
+
+    # 同一帧内容的新任务命中缓存，并移到最近使用的位置
+    hit = module._process_task(_make_cache_task(module, frames[0].copy()))
+    assert hit is results[0]
+    assert list(module._frame_cache) == [keys[1], keys[0]]
+
+    # 超出上限时淘汰最久未使用的项，而不是最早插入的项
+    module._update_cache(tasks[2], results[2])
+    assert list(module._frame_cache) == [keys[0], keys[2]]
+
+    # 缩小缓存时同样按LRU顺序淘汰
+    module.set_cache_size(1)
+    assert list(module._frame_cache) == [keys[2]]
+
+    with pytest.raises(ValueError):
+        module.set_cache_size(-1)
+    module.destroy()
+
+def test_cache_key_distinguishes_small_changes():
+    """测试只差少量像素的两帧得到不同的缓存键，不会误命中"""
+    module = ProcessingModule()
+    frame_a = np.zeros((64, 64), dtype=np.uint8)
+    frame_b = frame_a.copy()
+    frame_b[30:32, 30:32] = 255  # 暗场中的小目标
+
+    task_a = _make_cache_task(module, frame_a)
+    task_b = _make_cache_task(module, frame_b)
+    key_a = module._get_cache_key(task_a)
+    key_b = module._get_cache_key(task_b)
+    assert key_a != key_b
+
+    module._update_cache(task_a, _make_result())
+    assert key_b not in module._frame_cache
+
+    # 内容相同的不同帧对象得到相同的键；模式不同则键不同
+    assert module._get_cache_key(_make_cache_task(module, frame_a.copy())) == key_a
+    assert module._get_cache_key(
+        _make_cache_task(module, frame_a, ProcessingMode.QUAD_COLOR)) != key_a
+    module.destroy()
+
+def test_cache_key_fingerprint_speed():
+    """测试整帧指纹不慢于 hash(frame.tobytes()) 基线"""
+    module = ProcessingModule()
+    frame = np.random.randint(0, 256, (2048, 2448), dtype=np.uint8)
+
+    def best_of(func, repeat=5):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    def fingerprint():
+        # 清除按帧对象复用的指纹，每次都对整帧重新计算
+        module._last_frame_hash = (None, 0)
+        module._get_cache_key(_make_cache_task(module, frame))
+
+    baseline = best_of(lambda: hash(frame.tobytes()))
+    assert best_of(fingerprint) < baseline * 1.5
+    module.destroy()
+
+def test_polarization_gray_composite():
+    """测试偏振模式灰度合成图 - 先对四角度彩色图求平均再转灰度"""
+    module = ProcessingModule()
+    raw_image = np.random.randint(0, 256, (32, 32), dtype=np.uint8)
+    decoded = ImageProcessor.demosaic_polarization(raw_image)
+    expected = cv2.cvtColor(np.mean(decoded, axis=0).astype(np.uint8), cv2.COLOR_BGR2GRAY)
+
+    task = _make_cache_task(module, raw_image, ProcessingMode.POLARIZATION)
+    images, metadata, wb_gains = module._process_polarization(task)
+    assert metadata['is_color'] is False
+    assert wb_gains is None
+    assert np.array_equal(images[0], expected)
+    module.destroy()